@@ -3,15 +3,22 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 import asyncio
-from datetime import datetime, timezone
-from typing import Optional, Dict, Any, List, cast
+import bisect
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Set, Tuple, cast
 import random
 import json
 import os
+import hashlib
 import time
 import re
 import math
+import mmap
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json produces the same files
+    orjson = None
 from discord.abc import Messageable  # for safe .send()
 
 from Constants.variables import DEFAULT_GUILD_ID, DATA_DIR
@@ -32,43 +39,177 @@ from .pokemons import (
 
 os.makedirs(DATA_DIR, exist_ok=True)
 DATA_FILE = os.path.join(DATA_DIR, "auctions.json")
+BACKUP_FILE = DATA_FILE + ".bak"  # previous snapshot, used if DATA_FILE is bad
+# Append-only log, one JSON object per line:
+# {"user_id": int, "pokemon": str, "unique_id": int, "received_ts": float}
+INVENTORY_FILE = os.path.join(DATA_DIR, "inventory.jsonl")
+
+def make_default_state() -> Dict[str, Any]:
+    """A fresh, empty state document."""
+    return {
+        "coins": {},  # user_id -> int (str keys on disk)
+        "auctions": {},  # aid -> auction dict (str keys on disk)
+        "next_aid": 11500,  # incrementing auction id (also default UID)
+        "banned": set()  # int user ids (a sorted list on disk)
+    }
+
+
+def _encode_default(obj: Any) -> Any:
+    # sets (the ban list) go out sorted so identical state encodes identically
+    if isinstance(obj, set):
+        return sorted(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not serializable")
+
+
+def _encode(data: Dict[str, Any]) -> bytes:
+    # in-memory maps are keyed by int ids; both encoders stringify them
+    if orjson is not None:
+        return orjson.dumps(data,
+                            default=_encode_default,
+                            option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, separators=(",", ":"),
+                      default=_encode_default).encode()
+
+
+_decode = orjson.loads if orjson is not None else json.loads
+
+
+def _fsync_dir(path: str) -> None:
+    """Persist renames in `path`; best-effort where dirs can't be opened."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _write_atomic(payload: bytes) -> None:
+    tmp = DATA_FILE + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    if os.path.exists(DATA_FILE):
+        os.replace(DATA_FILE, BACKUP_FILE)
+    os.replace(tmp, DATA_FILE)
+    _fsync_dir(DATA_DIR)
 
-DEFAULT_STATE: Dict[str, Any] = {
-    "coins": {},  # str(user_id) -> int
-    "inventory":
-    {},  # str(user_id) -> list[{"pokemon": str, "unique_id": int, "received_ts": float}]
-    "auctions": {},  # str(aid) -> auction dict
-    "next_aid": 11500,  # incrementing auction id (also default UID)
-    "banned": []  # list[int user_id]
-}
 
+def _read_state(path: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path, "rb") as f:
+            if orjson is None:
+                return _decode(f.read())
+            # parse straight off the page cache instead of copying into bytes
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):  # empty file / mmap unsupported
+                return _decode(f.read())
+            with mm, memoryview(mm) as view:
+                return orjson.loads(view)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:  # ValueError: bad JSON or UTF-8
+        pretty_log("error", f"Unreadable state file {path}: {e}",
+                   include_trace=False)
+        return None
 
-def _load() -> Dict[str, Any]:
-    if not os.path.exists(DATA_FILE):
-        with open(DATA_FILE, "w", encoding="utf-8") as f:
-            json.dump(DEFAULT_STATE, f, indent=2)
-        return json.loads(json.dumps(DEFAULT_STATE))
-    with open(DATA_FILE, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    for k, v in DEFAULT_STATE.items():
-        if k not in data:
-            data[k] = json.loads(json.dumps(v))
-    return data
 
+def _normalize_auction(auc: Dict[str, Any]) -> Dict[str, Any]:
+    """Coerce id/amount fields to int once so readers can skip the casts."""
+    auc["auction_id"] = int(auc["auction_id"])
+    auc["unique_id"] = int(auc["unique_id"])
+    auc["min_bid"] = int(auc.get("min_bid", DEFAULT_MIN_BID))
+    top = auc.get("top_bid")
+    if top:
+        top["user_id"] = int(top["user_id"])
+        top["amount"] = int(top["amount"])
+    return auc
 
-def _save(data: Dict[str, Any]) -> None:
-    tmp = DATA_FILE + ".tmp"
-    with open(tmp, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
-    os.replace(tmp, DATA_FILE)
+
+def _load() -> Dict[str, Any]:
+    # A crash between the two renames in _write_atomic leaves only the .bak
+    data = _read_state(DATA_FILE)
+    if data is None:
+        data = _read_state(BACKUP_FILE)
+    if data is None:
+        data = make_default_state()
+        if not (os.path.exists(DATA_FILE) or os.path.exists(BACKUP_FILE)):
+            _write_atomic(_encode(data))
+        return data
+    for k, v in make_default_state().items():
+        data.setdefault(k, v)
+    data["coins"] = {int(k): v for k, v in data["coins"].items()}
+    # older saves may hold string ids; keep ints so checks always match
+    data["banned"] = {int(u) for u in data["banned"]}
+    data["auctions"] = {
+        int(k): _normalize_auction(v)
+        for k, v in data["auctions"].items()
+    }
+    return data
 
 
 def load_data() -> Dict[str, Any]:
     return _load()
 
 
-def save_data(data: Dict[str, Any]) -> None:
-    _save(data)
+def _encode_inventory(records: List[Dict[str, Any]]) -> bytes:
+    return b"".join(_encode(r) + b"\n" for r in records)
+
+
+def _append_inventory(payload: bytes) -> None:
+    with open(INVENTORY_FILE, "ab") as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def _truncate_inventory() -> None:
+    open(INVENTORY_FILE, "wb").close()
+
+
+def load_inventory(
+        legacy: Optional[Dict[str, Any]] = None
+) -> Dict[int, List[Dict[str, Any]]]:
+    """Replay the inventory log into user_id -> items.
+
+    `legacy` is the old in-state inventory map; it seeds the log once.
+    """
+    if legacy and not os.path.exists(INVENTORY_FILE):
+        payload = _encode_inventory([{
+            "user_id": int(uid),
+            **it
+        } for uid, items in legacy.items() for it in items])
+        tmp = INVENTORY_FILE + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, INVENTORY_FILE)
+        _fsync_dir(DATA_DIR)
+
+    inv: Dict[int, List[Dict[str, Any]]] = {}
+    if not os.path.exists(INVENTORY_FILE):
+        return inv
+    with open(INVENTORY_FILE, "r+b") as f:
+        raw = f.read()
+        end = raw.rfind(b"\n") + 1
+        if end != len(raw):
+            # cut a torn tail from an interrupted append so the next record
+            # starts on its own line instead of being glued onto it
+            f.truncate(end)
+            f.flush()
+            os.fsync(f.fileno())
+    for line in raw[:end].splitlines():
+        try:
+            rec = _decode(line)
+        except ValueError:
+            continue  # blank, torn (interrupted append) or non-UTF-8 line
+        inv.setdefault(int(rec.pop("user_id")), []).append(rec)
+    return inv
 
 
 # ---------------- Config / Defaults ---------------- #
@@ -77,52 +218,72 @@ AUCTION_DURATION_DEFAULT = 48 * 60 * 60  # 48h
 WHITELIST_ROLE = 1375712535512354898  # admins also pass check
 STARTING_COINS = 1000
 DEFAULT_MIN_BID = 10
+MAX_MIN_BID = 10_000_000
 AUCTION_REPORT_CHANNEL_ID = 1375701354751725639  # your dedicated report channel
+FLUSH_DEBOUNCE = 0.25  # seconds to coalesce a burst of mutations into one write
+FLUSH_RETRY_DELAY = 5  # seconds before retrying a failed save
+WHITELIST_CACHE_TTL = 60  # seconds a permission check result is reused
+USER_CACHE_TTL = 300  # seconds a fetched (uncached) user is reused
+USER_CACHE_MAX = 256  # oldest fetched user is evicted past this
+SETTLE_JITTER_MAX = 30  # max seconds a close timer is spread past end_ts
+SETTLE_CONCURRENCY = 4  # timer-driven settlements running at once
+BID_LOCK_POOL_MAX = 32  # idle bid locks kept for reuse by new auctions
+
+# Shared guild target for every slash command below
+_GUILD_OBJ = discord.Object(id=DEFAULT_GUILD_ID)
 
 # Pagination (PokéMeow style: many auctions per page)
 COMPACT_LINES_PER_PAGE = 20
 
 # ---------------- Utilities ---------------- #
 
+_DURATION_RE = re.compile(r"(\d+(?:\.\d+)?)([dhm])")
+_UNIT_SECS = {"d": 86400, "h": 3600, "m": 60}
+
 
 def parse_duration(s: Optional[str]) -> int:
     """Parse '3d', '12h', '30m' -> seconds; None -> default."""
     if not s:
         return AUCTION_DURATION_DEFAULT
     s = s.strip().lower()
-    m = re.fullmatch(r"(\d+(?:\.\d+)?)([dhm])", s)
+    m = _DURATION_RE.fullmatch(s)
     if not m:
         try:
             return max(1, int(float(s)))  # raw seconds
         except Exception:
             return AUCTION_DURATION_DEFAULT
-    val = float(m.group(1))
-    unit = m.group(2)
-    if unit == "d":
-        return int(val * 86400)
-    if unit == "h":
-        return int(val * 3600)
-    if unit == "m":
-        return int(val * 60)
-    return AUCTION_DURATION_DEFAULT
+    return max(1, int(float(m.group(1)) * _UNIT_SECS[m.group(2)]))
+
+
+class DurationTransformer(app_commands.Transformer):
+    """Slash option typed as text ('3d', '12h', '30m') that arrives as seconds."""
+
+    @property
+    def max_value(self) -> int:
+        return 16  # string options: max length
+
+    async def transform(self, interaction: discord.Interaction,
+                        value: str) -> int:
+        return parse_duration(value)
+
+
+Duration = app_commands.Transform[int, DurationTransformer]
+# Discord rejects out-of-range values before the command runs
+MinBid = app_commands.Range[int, 1, MAX_MIN_BID]
 
 
 def now_ts() -> float:
-    return datetime.now(timezone.utc).timestamp()
+    return time.time()  # epoch seconds, same as an aware UTC datetime
 
 
 def time_left_str(end_ts: float) -> str:
     rem = max(0, int(end_ts - now_ts()))
+    if rem < 60:
+        return f"{rem}s"
     d, r = divmod(rem, 86400)
-    h, r = divmod(r, 3600)
-    m, s = divmod(r, 60)
-    parts: List[str] = []
-    if d: parts.append(f"{d}d")
-    if h: parts.append(f"{h}h")
-    if m: parts.append(f"{m}m")
-    if not parts:
-        parts.append(f"{s}s")
-    return " ".join(parts)
+    h, m = divmod(r // 60, 60)
+    return " ".join(
+        f"{v}{u}" for v, u in ((d, "d"), (h, "h"), (m, "m")) if v)
 
 
 def to_messageable(obj: object) -> Optional[Messageable]:
@@ -135,6 +296,11 @@ def to_messageable(obj: object) -> Optional[Messageable]:
     return None
 
 
+def _channel_id(interaction: discord.Interaction) -> int:
+    """Channel the interaction came from; 0 when unknown."""
+    return interaction.channel_id or 0
+
+
 def min_required_after(last_bid: int, min_bid: int) -> int:
     """
     Next min bid rule:
@@ -149,17 +315,33 @@ def min_required_after(last_bid: int, min_bid: int) -> int:
 # ---------------- Permissions ---------------- #
 
 
+# (guild_id, user_id) -> (allowed, checked_at monotonic)
+_whitelist_cache: Dict[Tuple[int, int], Tuple[bool, float]] = {}
+
+
 def is_admin_or_whitelisted(member: Optional[discord.Member]) -> bool:
     if member is None:
         return False
-    return member.guild_permissions.administrator or any(r.id == WHITELIST_ROLE
-                                                         for r in member.roles)
+    key = (member.guild.id, member.id)
+    now = time.monotonic()
+    hit = _whitelist_cache.get(key)
+    if hit is not None and now - hit[1] < WHITELIST_CACHE_TTL:
+        return hit[0]
+    # get_role bisects the member's sorted role id list instead of building
+    # Role objects for every role like member.roles does.
+    allowed = (member.get_role(WHITELIST_ROLE) is not None
+               or member.guild_permissions.administrator)
+    _whitelist_cache[key] = (allowed, now)
+    return allowed
 
 
 async def check_admin_whitelist(interaction: discord.Interaction) -> bool:
     if interaction.guild is None:
         raise app_commands.CheckFailure("Server-only.")
-    member = interaction.guild.get_member(interaction.user.id)
+    # guild interactions already carry the invoking Member (with roles)
+    member = interaction.user
+    if not isinstance(member, discord.Member):
+        member = interaction.guild.get_member(interaction.user.id)
     if not is_admin_or_whitelisted(member):
         raise app_commands.CheckFailure("Only admins/whitelisted.")
     return True
@@ -174,53 +356,44 @@ class AuctionListView(discord.ui.View):
     def __init__(self,
                  cog_ref: "AuctionSystem",
                  viewer_id: int,
-                 auction_ids: List[int],
                  timeout: int = 120):
         super().__init__(timeout=timeout)
         self.cog_ref = cog_ref
         self.viewer_id = viewer_id
-        self.auction_ids = auction_ids
         self.page = 0
+        # one embed per view, re-filled on each page turn
+        self._embed = discord.Embed(color=discord.Color.gold())
 
     def total_pages(self) -> int:
-        if not self.auction_ids:
+        n = len(self.cog_ref._active)
+        if not n:
             return 1
-        return (len(self.auction_ids) + COMPACT_LINES_PER_PAGE -
-                1) // COMPACT_LINES_PER_PAGE
+        return (n + COMPACT_LINES_PER_PAGE - 1) // COMPACT_LINES_PER_PAGE
 
-    def slice_ids(self) -> List[int]:
+    def slice_entries(self) -> List[Tuple[float, int]]:
+        # pages read the live index, so closed auctions drop out in place
+        self.page = min(self.page, self.total_pages() - 1)
         start = self.page * COMPACT_LINES_PER_PAGE
         end = start + COMPACT_LINES_PER_PAGE
-        return self.auction_ids[start:end]
+        return self.cog_ref._active[start:end]
 
     def build_embed(self, viewer_id: int) -> discord.Embed:
-        ids = self.slice_ids()
-        auctions = [self.cog_ref.get_auction(aid) for aid in ids]
-        auctions = [a for a in auctions if a and not a.get("is_closed")]
-
-        if not auctions:
-            emb = discord.Embed(
-                description="❌ No active auctions on this page.",
-                color=discord.Color.gold())
+        entries = self.slice_entries()
+
+        emb = self._embed
+        if not entries:
+            emb.title = None
+            emb.description = "❌ No active auctions on this page."
+            emb.remove_footer()
             emb.set_author(name=f"Page {self.page+1}/{self.total_pages()}")
             return emb
 
-        lines: List[str] = []
-        for a in auctions:
-            top = a.get("top_bid")
-            if top:
-                bid_txt = f"{int(top['amount'])} {COIN} • <@{int(top['user_id'])}>"
-            else:
-                bid_txt = f"min {int(a.get('min_bid', DEFAULT_MIN_BID))} {COIN}"
-            tl = time_left_str(float(a["end_ts"]))
-            lines.append(
-                f"`#{int(a['auction_id'])}` • **{a['pokemon']}** (UID {int(a['unique_id'])}) — {bid_txt} • ends in {tl}"
-            )
-
-        desc = "\n".join(lines)
-        emb = discord.Embed(title="📜 Active Auctions",
-                            description=desc[:4000],
-                            color=discord.Color.gold())
+        line_for = self.cog_ref.list_line
+        desc = "\n".join(f"{line_for(aid)} • ends in {time_left_str(end)}"
+                         for end, aid in entries)
+        emb.title = "📜 Active Auctions"
+        emb.description = desc[:4000]
+        emb.remove_author()
         emb.set_footer(
             text=
             f"Page {self.page+1}/{self.total_pages()} • Use /auction_info or /auction_bid"
@@ -234,15 +407,18 @@ class AuctionListView(discord.ui.View):
     @discord.ui.button(label="⬅️ Back", style=discord.ButtonStyle.secondary)
     async def back_btn(self, interaction: discord.Interaction,
                        button: discord.ui.Button):
-        if self.page > 0:
-            self.page -= 1
+        if self.page == 0:
+            # already on the first page: ack without an edit call
+            return await interaction.response.defer()
+        self.page -= 1
         await self.refresh(interaction)
 
     @discord.ui.button(label="Next ➡️", style=discord.ButtonStyle.secondary)
     async def next_btn(self, interaction: discord.Interaction,
                        button: discord.ui.Button):
-        if self.page < self.total_pages() - 1:
-            self.page += 1
+        if self.page >= self.total_pages() - 1:
+            return await interaction.response.defer()
+        self.page += 1
         await self.refresh(interaction)
 
 
@@ -253,67 +429,290 @@ class AuctionSystem(commands.Cog):
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.data: Dict[str, Any] = load_data()
-        self.tasks: Dict[int, asyncio.Task] = {}  # auto-close tasks
+        self.data: Dict[str, Any] = {}  # filled in cog_load
+        self.tasks: Dict[int, asyncio.TimerHandle] = {}  # auto-close timers
+        self._settling: Set[asyncio.Task] = set()  # fired timers mid-settle
+        self._settle_sem = asyncio.Semaphore(SETTLE_CONCURRENCY)
+        # set by on_ready; timed closes wait on it so DMs and reports can
+        # resolve users and channels (bot.wait_until_ready() raises before
+        # login, and cog_load runs before login)
+        self._gateway_ready = asyncio.Event()
+        self._report_channel: Optional[Messageable] = None
+        # user_id -> (user, fetched_at) for users missing from the bot cache
+        self._user_cache: Dict[int, Tuple[discord.User, float]] = {}
+        self._loop: asyncio.AbstractEventLoop  # bound in cog_load
         self.bid_locks: Dict[int, asyncio.Lock] = {}  # per-auction locks
+        self._lock_pool: List[asyncio.Lock] = []  # released, reusable
+        # open auctions as sorted (end_ts, aid), aid -> (end_ts, name key),
+        # and lowercased pokemon name -> open aids
+        self._active: List[Tuple[float, int]] = []
+        self._active_keys: Dict[int, Tuple[float, str]] = {}
+        self._by_name: Dict[str, Set[int]] = {}
+        # aid -> list line minus the time left; dropped on every save
+        self._line_cache: Dict[int, str] = {}
+        self._dirty = False  # state changed since last flush
+        self._last_digest: Optional[bytes] = None  # of the last snapshot written
+        self.inventory: Dict[int, List[Dict[str, Any]]] = {}
+        self._inv_pending: List[Dict[str, Any]] = []  # not yet in the log
+        self._save_lock = asyncio.Lock()
+        # all file I/O runs on one dedicated thread: writes stay ordered and
+        # never queue behind other to_thread work in the default pool
+        self._io = ThreadPoolExecutor(max_workers=1,
+                                      thread_name_prefix="auctions-io")
+        self._flush_handle: Optional[asyncio.TimerHandle] = None  # armed
+        self._flush_task: Optional[asyncio.Task] = None  # flush in progress
+
+    async def cog_load(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self.data = await self._run_io(load_data)
+        legacy_inv = self.data.pop("inventory", None)
+        self.inventory = await self._run_io(load_inventory, legacy_inv)
+        if legacy_inv is not None:
+            self._mark_dirty()  # drop the migrated map from the snapshot
+        self._rebuild_index()
+        if self.bot.is_ready():  # reloaded on a running bot
+            self._gateway_ready.set()
         self.recover_tasks()
 
+    async def cog_unload(self) -> None:
+        for handle in self.tasks.values():
+            handle.cancel()
+        self.tasks.clear()
+        # a settlement finishing after unload would mark a dead cog dirty;
+        # closes not yet applied stay open and are recovered on next load
+        settling, self._settling = self._settling, set()
+        for task in settling:
+            task.cancel()
+        await asyncio.gather(*settling, return_exceptions=True)
+        # flush() waits on the save lock for any in-flight write, so the
+        # flush task is only cancelled once it can't be mid-write
+        await self.flush()
+        for pending in (self._flush_handle, self._flush_task):
+            if pending is not None:
+                pending.cancel()
+        self._io.shutdown(wait=False)  # idle: the final flush has finished
+
+    # ----- Persistence -----
+
+    def _run_io(self, fn, *args) -> "asyncio.Future[Any]":
+        return self._loop.run_in_executor(self._io, fn, *args)
+
+    def _mark_dirty(self) -> None:
+        """Flag state for the background flusher instead of writing now."""
+        self._dirty = True
+        self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        # a flush already in progress re-arms itself when it finishes
+        if self._flush_handle is None and (self._flush_task is None
+                                           or self._flush_task.done()):
+            self._arm_flush(FLUSH_DEBOUNCE)
+
+    def _arm_flush(self, delay: float) -> None:
+        self._flush_handle = self._loop.call_later(delay, self._spawn_flush)
+
+    def _spawn_flush(self) -> None:
+        self._flush_handle = None
+        self._flush_task = asyncio.create_task(self._run_flush())
+
+    async def flush(self) -> None:
+        async with self._save_lock:
+            if self._inv_pending:
+                pending, self._inv_pending = self._inv_pending, []
+                try:
+                    await self._run_io(_append_inventory,
+                                       _encode_inventory(pending))
+                except Exception:
+                    self._inv_pending[:0] = pending
+                    raise
+            if not self._dirty:
+                return
+            self._dirty = False
+            # encode on the loop so the snapshot can't change mid-dump (a
+            # worker thread would hold the GIL for the encode just the same)
+            payload = _encode(self.data)
+            # idempotent commands (re-register, a no-op ban) mark dirty too
+            digest = hashlib.blake2b(payload, digest_size=16).digest()
+            if digest == self._last_digest:
+                return
+            try:
+                await self._run_io(_write_atomic, payload)
+            except Exception:
+                self._dirty = True
+                raise
+            self._last_digest = digest
+
+    async def _run_flush(self) -> None:
+        delay = FLUSH_DEBOUNCE
+        try:
+            await self.flush()
+        except Exception as e:
+            pretty_log("error", f"Failed to save auction data: {e}")
+            delay = FLUSH_RETRY_DELAY
+        # mutations that landed during the write (or a failed one) go next
+        if (self._dirty or self._inv_pending) and self._flush_handle is None:
+            self._arm_flush(delay)
+
+    # ----- Listeners -----
+
+    @commands.Cog.listener()
+    async def on_ready(self) -> None:
+        self._gateway_ready.set()
+
+    @commands.Cog.listener()
+    async def on_member_update(self, before: discord.Member,
+                               after: discord.Member) -> None:
+        if before.roles != after.roles:
+            _whitelist_cache.pop((after.guild.id, after.id), None)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(
+            self, channel: discord.abc.GuildChannel) -> None:
+        if channel.id == AUCTION_REPORT_CHANNEL_ID:
+            self._report_channel = None
+
+    @commands.Cog.listener()
+    async def on_guild_channel_update(self, before: discord.abc.GuildChannel,
+                                      after: discord.abc.GuildChannel) -> None:
+        if after.id == AUCTION_REPORT_CHANNEL_ID:
+            self._report_channel = None
+
     # ----- Balances / Inventory -----
 
     def get_balance(self, user_id: int) -> int:
-        return int(self.data["coins"].get(str(user_id), STARTING_COINS))
+        return int(self.data["coins"].get(user_id, STARTING_COINS))
 
     def add_balance(self, user_id: int, delta: int) -> None:
-        uid = str(user_id)
-        self.data["coins"][uid] = self.get_balance(user_id) + int(delta)
-        save_data(self.data)
+        coins = self.data["coins"]
+        coins[user_id] = int(coins.get(user_id, STARTING_COINS)) + int(delta)
+        self._mark_dirty()
 
     def set_balance(self, user_id: int, amount: int) -> None:
-        uid = str(user_id)
-        self.data["coins"][uid] = int(amount)
-        save_data(self.data)
+        self.data["coins"][user_id] = int(amount)
+        self._mark_dirty()
 
     def get_inventory(self, user_id: int) -> List[Dict[str, Any]]:
         # return a shallow copy to keep typing consistent
-        return list(self.data["inventory"].get(str(user_id), []))
+        return list(self.inventory.get(user_id, []))
 
     def add_inventory(self, user_id: int, pokemon: str,
                       unique_id: int) -> None:
-        uid = str(user_id)
-        lst: List[Dict[str, Any]] = self.data["inventory"].setdefault(uid, [])
-        lst.append({
+        item = {
             "pokemon": pokemon,
             "unique_id": int(unique_id),
             "received_ts": time.time()
-        })
-        save_data(self.data)
+        }
+        self.inventory.setdefault(user_id, []).append(item)
+        # only the new line is written; the state snapshot is untouched
+        self._inv_pending.append({"user_id": user_id, **item})
+        self._schedule_flush()
+
+    # ----- Bid locks -----
+
+    def bid_lock(self, auction_id: int) -> asyncio.Lock:
+        lock = self.bid_locks.get(auction_id)
+        if lock is None:
+            lock = self._lock_pool.pop() if self._lock_pool else asyncio.Lock()
+            self.bid_locks[auction_id] = lock
+        return lock
+
+    def release_bid_lock(self, auction_id: int) -> None:
+        """Drop a closed auction's lock, keeping it for reuse if idle."""
+        lock = self.bid_locks.pop(auction_id, None)
+        # a held lock is left to its waiters (they re-check is_closed and
+        # bail). Reusing a lock a stale waiter is about to wake on is safe:
+        # it only serializes that rejected bid with the new auction's bids.
+        if (lock is not None and not lock.locked()
+                and len(self._lock_pool) < BID_LOCK_POOL_MAX):
+            self._lock_pool.append(lock)
 
     # ----- Auction model -----
 
     def next_aid(self) -> int:
-        aid = int(self.data.get("next_aid", 11500))
-        self.data["next_aid"] = aid + 1
-        save_data(self.data)
-        return aid
+        return self.reserve_aids(1)[0]
+
+    def reserve_aids(self, count: int) -> range:
+        """Allocate `count` consecutive auction ids with one counter bump."""
+        start = int(self.data.get("next_aid", 11500))
+        self.data["next_aid"] = start + count
+        self._mark_dirty()
+        return range(start, start + count)
 
     def get_auction(self, auction_id: int) -> Optional[Dict[str, Any]]:
-        return self.data["auctions"].get(str(auction_id))
+        return self.data["auctions"].get(auction_id)
 
     def save_auction(self, auc: Dict[str, Any]) -> None:
-        self.data["auctions"][str(auc["auction_id"])] = auc
-        save_data(self.data)
+        """Store `auc` as the new version of its auction.
+
+        Stored auctions are copy-on-write: change one by saving an updated
+        copy, never by mutating the dict get_auction returned, so readers
+        holding a reference always see a consistent version.
+        """
+        _normalize_auction(auc)
+        self.data["auctions"][auc["auction_id"]] = auc
+        self._line_cache.pop(int(auc["auction_id"]), None)
+        self._index_auction(auc)
+        self._mark_dirty()
 
     def delete_auction(self, auction_id: int) -> None:
-        self.data["auctions"].pop(str(auction_id), None)
-        save_data(self.data)
+        self.data["auctions"].pop(auction_id, None)
+        self._line_cache.pop(int(auction_id), None)
+        self._unindex(int(auction_id))
+        self._mark_dirty()
 
     def active_auctions(self) -> List[Dict[str, Any]]:
-        return [
-            a for a in self.data["auctions"].values() if not a.get("is_closed")
-        ]
+        """Open auctions, soonest-ending first."""
+        auctions = self.data["auctions"]
+        return [auctions[aid] for _, aid in self._active]
+
+    def _unindex(self, auction_id: int) -> None:
+        keys = self._active_keys.pop(auction_id, None)
+        if keys is None:
+            return
+        end, name = keys
+        del self._active[bisect.bisect_left(self._active, (end, auction_id))]
+        aids = self._by_name[name]
+        aids.discard(auction_id)
+        if not aids:
+            del self._by_name[name]
+
+    def _index_auction(self, auc: Dict[str, Any]) -> None:
+        aid = int(auc["auction_id"])
+        self._unindex(aid)
+        if not auc.get("is_closed"):
+            end = float(auc["end_ts"])
+            name = auc["pokemon"].lower()
+            self._active_keys[aid] = (end, name)
+            bisect.insort(self._active, (end, aid))
+            self._by_name.setdefault(name, set()).add(aid)
+
+    def _rebuild_index(self) -> None:
+        self._active, self._active_keys, self._by_name = [], {}, {}
+        for a in self.data["auctions"].values():
+            if not a.get("is_closed"):
+                aid = int(a["auction_id"])
+                name = a["pokemon"].lower()
+                self._active_keys[aid] = (float(a["end_ts"]), name)
+                self._by_name.setdefault(name, set()).add(aid)
+        self._active = sorted(
+            (end, aid) for aid, (end, _) in self._active_keys.items())
 
     # ----- Embeds -----
 
+    def list_line(self, auction_id: int) -> str:
+        """Compact list line for an open auction, without the time left."""
+        line = self._line_cache.get(auction_id)
+        if line is None:
+            a = self.data["auctions"][auction_id]
+            top = a.get("top_bid")
+            if top:
+                bid_txt = f"{top['amount']} {COIN} • <@{top['user_id']}>"
+            else:
+                bid_txt = f"min {a['min_bid']} {COIN}"
+            line = f"`#{auction_id}` • **{a['pokemon']}** (UID {a['unique_id']}) — {bid_txt}"
+            self._line_cache[auction_id] = line
+        return line
+
     def auction_embed(self,
                       auc: Dict[str, Any],
                       viewer_balance: Optional[int] = None) -> discord.Embed:
@@ -347,38 +746,79 @@ class AuctionSystem(commands.Cog):
                           value=f"{int(viewer_balance)} {COIN}")
         return emb
 
+    def report_channel(self) -> Optional[Messageable]:
+        """Resolve the report channel once and reuse it."""
+        if self._report_channel is None:
+            self._report_channel = to_messageable(
+                self.bot.get_channel(AUCTION_REPORT_CHANNEL_ID))
+        return self._report_channel
+
+    async def fetch_user_cached(self, user_id: int) -> discord.User:
+        """get_user, falling back to a TTL-cached fetch_user."""
+        user = self.bot.get_user(user_id)
+        if user is not None:
+            return user
+        now = time.monotonic()
+        hit = self._user_cache.get(user_id)
+        if hit is not None and now - hit[1] < USER_CACHE_TTL:
+            return hit[0]
+        user = await self.bot.fetch_user(user_id)
+        self._user_cache.pop(user_id, None)
+        if len(self._user_cache) >= USER_CACHE_MAX:
+            self._user_cache.pop(next(iter(self._user_cache)))
+        self._user_cache[user_id] = (user, now)
+        return user
+
     # ----- Task runner / recovery -----
 
     def recover_tasks(self) -> None:
-        cur = now_ts()
+        # auctions that expired while offline get a zero delay and settle
+        # as soon as the gateway is ready
         for raw in self.data["auctions"].values():
-            if not raw.get("is_closed") and float(raw.get("end_ts", 0)) > cur:
+            if not raw.get("is_closed"):
                 aid = int(raw["auction_id"])
-                if aid not in self.tasks or self.tasks[aid].done():
-                    self.tasks[aid] = asyncio.create_task(
-                        self._wait_and_close(aid))
-
-    async def _wait_and_close(self, auction_id: int) -> None:
-        auc = self.get_auction(auction_id)
-        if not auc or auc.get("is_closed"):
-            return
-        delay = max(0, float(auc["end_ts"]) - now_ts())
-        try:
-            await asyncio.sleep(delay)
-        except asyncio.CancelledError:
-            return
-        auc = self.get_auction(auction_id)
-        if not auc or auc.get("is_closed"):
-            return
-        await self.settle_auction(auc)
+                if aid not in self.tasks:
+                    self.schedule_close(aid, float(raw["end_ts"]))
+
+    def schedule_close(self, auction_id: int, end_ts: float) -> None:
+        """Arm a one-shot loop timer that settles the auction at end_ts."""
+        old = self.tasks.pop(auction_id, None)
+        if old is not None:
+            old.cancel()
+        # a bulk drop shares one end_ts: spread the closes so their DMs and
+        # reports don't all hit the rate limiter at once (bids already stop
+        # at end_ts, so the spread doesn't extend the auction)
+        jitter = random.random() * min(SETTLE_JITTER_MAX,
+                                       len(self.tasks) * 0.05)
+        delay = max(0.0, end_ts - now_ts()) + jitter
+        self.tasks[auction_id] = self._loop.call_later(delay,
+                                                       self._spawn_close,
+                                                       auction_id)
+
+    def _spawn_close(self, auction_id: int) -> None:
+        self.tasks.pop(auction_id, None)
+        task = asyncio.create_task(self._close_if_open(auction_id))
+        self._settling.add(task)
+        task.add_done_callback(self._settling.discard)
+
+    async def _close_if_open(self, auction_id: int) -> None:
+        # auctions that expired while offline fire before login completes
+        await self._gateway_ready.wait()
+        async with self._settle_sem:
+            auc = self.get_auction(auction_id)
+            if not auc or auc.get("is_closed"):
+                return
+            await self.settle_auction(auc)
 
     async def settle_auction(
             self,
             auc: Dict[str, Any],
             announce_channel: Optional[Messageable] = None) -> None:
         """Close and transfer prize to winner (if any) + report to channel + DM winner."""
-        auc["is_closed"] = True
+        auc = {**auc, "is_closed": True}
         self.save_auction(auc)
+        # bidders still queued on the lock re-check is_closed and bail out
+        self.release_bid_lock(auc["auction_id"])
 
         winner = auc.get("top_bid")
         winner_user_id: Optional[int] = None
@@ -391,25 +831,19 @@ class AuctionSystem(commands.Cog):
 
             # --- DM the winner (best-effort) ---
             try:
-                user_obj = self.bot.get_user(winner_user_id)
-                if user_obj is None:
-                    # fetch as a fallback if not cached
-                    user_obj = await self.bot.fetch_user(
-                        winner_user_id)  # type: ignore[assignment]
-                if user_obj is not None:
-                    dm_text = (
-                        f"🎉 You won auction `#{auc['auction_id']}`!\n"
-                        f"**{auc['pokemon']}** (UID {auc['unique_id']}) — for **{winner['amount']} {COIN}**.\n"
-                        f"✅ It’s been added to your inventory.")
-                    await user_obj.send(dm_text)
+                user_obj = await self.fetch_user_cached(winner_user_id)
+                dm_text = (
+                    f"🎉 You won auction `#{auc['auction_id']}`!\n"
+                    f"**{auc['pokemon']}** (UID {auc['unique_id']}) — for **{winner['amount']} {COIN}**.\n"
+                    f"✅ It’s been added to your inventory.")
+                await user_obj.send(dm_text)
             except Exception as e:
                 pretty_log(
                     "warn",
                     f"Could not DM auction winner {winner_user_id}: {e}")
 
         # Prefer dedicated report channel
-        report_raw = self.bot.get_channel(AUCTION_REPORT_CHANNEL_ID)
-        ch = to_messageable(report_raw)
+        ch = self.report_channel()
 
         # Fallbacks: stored channel, then the provided announce_channel
         if ch is None:
@@ -434,6 +868,8 @@ class AuctionSystem(commands.Cog):
                     )
                 await ch.send(embed=emb)
         except Exception as e:
+            if isinstance(e, discord.NotFound) and ch is self._report_channel:
+                self._report_channel = None  # re-resolve on the next close
             pretty_log("warn", f"Could not announce auction close: {e}")
 
     # ----- Internal helpers -----
@@ -447,52 +883,52 @@ class AuctionSystem(commands.Cog):
         min_bid: int,
     ) -> List[int]:
         """Create multiple auctions (one per name). Return created IDs."""
-        cid = int(channel_id) if channel_id else 0
-        created_ids: List[int] = []
-        for name in names:
-            aid = self.next_aid()
-            unique_id = aid
-            auc = {
+        cid = channel_id or 0
+        created_ts = time.time()
+        # bulk auctions use their aid as the UID
+        created: Dict[int, Dict[str, Any]] = {
+            aid: _normalize_auction({
                 "auction_id": aid,
                 "pokemon": name,
-                "unique_id": unique_id,
+                "unique_id": aid,
                 "created_by": created_by,
-                "created_ts": time.time(),
+                "created_ts": created_ts,
                 "end_ts": end_ts,
-                "min_bid": int(min_bid),
+                "min_bid": min_bid,
                 "top_bid": None,
                 "bids_received": 0,
                 "channel_id": cid,
                 "is_closed": False,
-            }
-            self.save_auction(auc)
-            created_ids.append(aid)
+            })
+            for aid, name in zip(self.reserve_aids(len(names)), names)
+        }
 
-            if aid in self.tasks and not self.tasks[aid].done():
-                self.tasks[aid].cancel()
-            self.tasks[aid] = asyncio.create_task(self._wait_and_close(aid))
-        return created_ids
+        # one merge for the whole batch instead of a save_auction per name;
+        # entries are normalized above just as save_auction would
+        self.data["auctions"].update(created)
+        for aid, auc in created.items():
+            self._index_auction(auc)
+            self.schedule_close(aid, end_ts)
+        self._mark_dirty()
+        return list(created)
 
     # ---------------- User Commands ---------------- #
 
     @app_commands.command(
         name="auction_list",
         description="List active auctions (PokéMeow-style pages)")
-    @app_commands.guilds(discord.Object(id=DEFAULT_GUILD_ID))
+    @app_commands.guilds(_GUILD_OBJ)
     async def auction_list(self, interaction: discord.Interaction):
-        auctions = sorted(self.active_auctions(),
-                          key=lambda a: float(a["end_ts"]))
-        if not auctions:
+        if not self._active:
             return await interaction.response.send_message(
                 "❌ No active auctions.", ephemeral=True)
-        ids = [int(a["auction_id"]) for a in auctions]
-        view = AuctionListView(self, interaction.user.id, ids)
+        view = AuctionListView(self, interaction.user.id)
         emb = view.build_embed(interaction.user.id)
         await interaction.response.send_message(embed=emb, view=view)
 
     @app_commands.command(name="auction_info",
                           description="Show details about one auction")
-    @app_commands.guilds(discord.Object(id=DEFAULT_GUILD_ID))
+    @app_commands.guilds(_GUILD_OBJ)
     async def auction_info(self, interaction: discord.Interaction, id: int):
         auc = self.get_auction(id)
         if not auc or auc.get("is_closed"):
@@ -504,17 +940,16 @@ class AuctionSystem(commands.Cog):
 
     @app_commands.command(name="auction_lookup",
                           description="Look up active auctions for a Pokémon")
-    @app_commands.guilds(discord.Object(id=DEFAULT_GUILD_ID))
+    @app_commands.guilds(_GUILD_OBJ)
     async def auction_lookup(self, interaction: discord.Interaction,
                              pokemon: str):
         c = canon(pokemon)
         if not c:
             return await interaction.response.send_message(
                 "❌ Pokémon not recognized.", ephemeral=True)
-        matches = [
-            a for a in self.active_auctions()
-            if a["pokemon"].lower() == c.lower()
-        ]
+        aids = sorted(self._by_name.get(c.lower(), ()),
+                      key=lambda aid: (self._active_keys[aid][0], aid))
+        matches = [self.data["auctions"][aid] for aid in aids]
         if not matches:
             return await interaction.response.send_message(
                 f"❌ No active auctions found for **{c}**.", ephemeral=True)
@@ -534,67 +969,86 @@ class AuctionSystem(commands.Cog):
 
     @app_commands.command(name="auction_bid",
                           description="Bid on an auction by ID")
-    @app_commands.guilds(discord.Object(id=DEFAULT_GUILD_ID))
+    @app_commands.guilds(_GUILD_OBJ)
     async def auction_bid(self, interaction: discord.Interaction, id: int,
                           amount: int):
         if amount <= 0:
             return await interaction.response.send_message(
                 "❌ Amount must be positive.", ephemeral=True)
-        if interaction.user.id in self.data.get("banned", []):
+        if interaction.user.id in self.data["banned"]:
             return await interaction.response.send_message("❌ You are banned.",
                                                            ephemeral=True)
 
+        # Only open auctions get a lock; it is dropped again when they close
+        auc = self.get_auction(id)
+        if not auc or auc.get("is_closed") or now_ts() >= auc["end_ts"]:
+            return await interaction.response.send_message(
+                "❌ Invalid or closed auction.", ephemeral=True)
+
         # Ensure single-threaded mutation per auction
-        lock = self.bid_locks.setdefault(id, asyncio.Lock())
+        lock = self.bid_lock(id)
         prev_bidder_id: Optional[int] = None
         prev_amount: Optional[int] = None
         min_bid_for_note: int = DEFAULT_MIN_BID
         new_amount: int = amount
         auc_snapshot: Optional[Dict[str, Any]] = None
 
+        # Rejections are recorded under the lock and sent after it is
+        # released, so queued bidders never wait on someone else's reply.
+        error: Optional[str] = None
+
         async with lock:
             auc = self.get_auction(id)
-            if not auc or auc.get("is_closed"):
-                return await interaction.response.send_message(
-                    "❌ Invalid or closed auction.", ephemeral=True)
-
-            min_bid = int(auc.get("min_bid", DEFAULT_MIN_BID))
-            top = auc.get("top_bid")
-            current = int(top["amount"]) if top else 0
-
-            # Min increment rule
-            required = min_required_after(current, min_bid)
-            if amount < required:
-                return await interaction.response.send_message(
-                    f"⚠️ Minimum next bid is **{required} {COIN}** (last bid {current} × 1.1).",
-                    ephemeral=True)
-
-            # Sufficient balance?
-            bal = self.get_balance(interaction.user.id)
-            if amount > bal:
-                return await interaction.response.send_message(
-                    f"❌ You don't have enough {COIN}.", ephemeral=True)
-
-            # Refund previous bidder, if any
-            if top:
-                prev_bidder_id = int(top["user_id"])
-                prev_amount = int(top["amount"])
-                self.add_balance(prev_bidder_id, prev_amount)
-
-            # Escrow new bidder
-            self.add_balance(interaction.user.id, -int(amount))
-            auc["top_bid"] = {
-                "user_id": interaction.user.id,
-                "amount": int(amount),
-                "ts": time.time()
-            }
-            auc["bids_received"] = int(auc.get("bids_received", 0)) + 1
-            self.save_auction(auc)
-
-            # capture for notification outside lock
-            min_bid_for_note = min_bid
-            new_amount = int(amount)
-            auc_snapshot = {"channel_id": int(auc.get("channel_id", 0))}
+            if not auc or auc.get("is_closed") or now_ts() >= auc["end_ts"]:
+                error = "❌ Invalid or closed auction."
+            else:
+                min_bid = int(auc.get("min_bid", DEFAULT_MIN_BID))
+                top = auc.get("top_bid")
+                current = int(top["amount"]) if top else 0
+
+                # Min increment rule
+                required = min_required_after(current, min_bid)
+                if amount < required:
+                    error = (
+                        f"⚠️ Minimum next bid is **{required} {COIN}** (last bid {current} × 1.1)."
+                    )
+                # Sufficient balance?
+                elif amount > self.get_balance(interaction.user.id):
+                    error = f"❌ You don't have enough {COIN}."
+                else:
+                    # Refund + escrow + new top bid are applied in memory
+                    # and persisted together by the single save_auction().
+                    coins = self.data["coins"]
+                    if top:
+                        prev_bidder_id = int(top["user_id"])
+                        prev_amount = int(top["amount"])
+                        coins[prev_bidder_id] = self.get_balance(
+                            prev_bidder_id) + prev_amount
+
+                    coins[interaction.user.id] = self.get_balance(
+                        interaction.user.id) - int(amount)
+                    auc = {
+                        **auc,
+                        "top_bid": {
+                            "user_id": interaction.user.id,
+                            "amount": int(amount),
+                            "ts": time.time()
+                        },
+                        "bids_received":
+                        int(auc.get("bids_received", 0)) + 1,
+                    }
+                    self.save_auction(auc)
+
+                    # capture for notification outside lock
+                    min_bid_for_note = min_bid
+                    new_amount = int(amount)
+                    auc_snapshot = {
+                        "channel_id": int(auc.get("channel_id", 0))
+                    }
+
+        if error is not None:
+            return await interaction.response.send_message(error,
+                                                           ephemeral=True)
 
         # Response to bidder
         await interaction.response.send_message(
@@ -620,14 +1074,14 @@ class AuctionSystem(commands.Cog):
                                f"Failed to notify previous bidder: {e}")
 
     @app_commands.command(name="coins", description="Check your balance")
-    @app_commands.guilds(discord.Object(id=DEFAULT_GUILD_ID))
+    @app_commands.guilds(_GUILD_OBJ)
     async def coins(self, interaction: discord.Interaction):
         balance = self.get_balance(interaction.user.id)
         await interaction.response.send_message(
             f"💰 You have {balance} {COIN}.", ephemeral=True)
 
     @app_commands.command(name="inventory", description="Show inventory")
-    @app_commands.guilds(discord.Object(id=DEFAULT_GUILD_ID))
+    @app_commands.guilds(_GUILD_OBJ)
     async def inventory_cmd(self,
                             interaction: discord.Interaction,
                             member: Optional[discord.Member] = None):
@@ -653,7 +1107,7 @@ class AuctionSystem(commands.Cog):
         name="legal_pokemon_list",
         description=
         "Show which Pokémon are legal in a generation or a named list")
-    @app_commands.guilds(discord.Object(id=DEFAULT_GUILD_ID))
+    @app_commands.guilds(_GUILD_OBJ)
     async def legal_pokemon_list(self, interaction: discord.Interaction,
                                  gen: str):
         """
@@ -678,23 +1132,26 @@ class AuctionSystem(commands.Cog):
         emb = discord.Embed(title=f"⚖️ Legal Pokémon — {label}",
                             color=discord.Color.teal())
 
-        chunk = ""
+        # fields hold ~1000 chars of "a, b, c"; each name costs len + 2
+        segs: List[str] = []
+        cur_len = 0
         start_idx = 1
         for name in names:
-            next_seg = f"{name}, "
-            if len(chunk) + len(next_seg) > 1000:
-                end_idx = start_idx + len(chunk.rstrip(', ').split(', ')) - 1
+            if segs and cur_len + len(name) + 2 > 1000:
+                end_idx = start_idx + len(segs) - 1
                 emb.add_field(name=f"Pokémon {start_idx}-{end_idx}",
-                              value=chunk.rstrip(", "),
+                              value=", ".join(segs),
                               inline=False)
                 start_idx = end_idx + 1
-                chunk = ""
-            chunk += next_seg
+                segs = []
+                cur_len = 0
+            segs.append(name)
+            cur_len += len(name) + 2
 
-        if chunk:
-            end_idx = start_idx + len(chunk.rstrip(', ').split(', ')) - 1
+        if segs:
+            end_idx = start_idx + len(segs) - 1
             emb.add_field(name=f"Pokémon {start_idx}-{end_idx}",
-                          value=chunk.rstrip(", "),
+                          value=", ".join(segs),
                           inline=False)
 
         await interaction.response.send_message(embed=emb)
@@ -705,12 +1162,11 @@ class AuctionSystem(commands.Cog):
     @app_commands.command(
         name="auc_register",
         description="Register a member with starting coins & empty inventory")
-    @app_commands.guilds(discord.Object(id=DEFAULT_GUILD_ID))
+    @app_commands.guilds(_GUILD_OBJ)
     async def auc_register(self, interaction: discord.Interaction,
                            member: discord.Member):
-        self.data["coins"].setdefault(str(member.id), STARTING_COINS)
-        self.data["inventory"].setdefault(str(member.id), [])
-        save_data(self.data)
+        self.data["coins"].setdefault(member.id, STARTING_COINS)
+        self._mark_dirty()
         await interaction.response.send_message(
             f"✅ Registered {member.display_name} with {STARTING_COINS} {COIN}!",
             ephemeral=True)
@@ -718,13 +1174,13 @@ class AuctionSystem(commands.Cog):
     @app_commands.check(check_admin_whitelist)
     @app_commands.command(name="auction_start",
                           description="Start a single auction")
-    @app_commands.guilds(discord.Object(id=DEFAULT_GUILD_ID))
+    @app_commands.guilds(_GUILD_OBJ)
     async def auction_start(self,
                             interaction: discord.Interaction,
                             pokemon: Optional[str] = None,
                             uid: Optional[int] = None,
-                            duration: Optional[str] = None,
-                            min_bid: Optional[int] = None):
+                            duration: Optional[Duration] = None,
+                            min_bid: MinBid = DEFAULT_MIN_BID):
         if pokemon:
             c = canon(pokemon)
             if not c:
@@ -734,12 +1190,11 @@ class AuctionSystem(commands.Cog):
         else:
             pokemon = random.choice(ALL_POKEMONS)
 
-        end_ts = now_ts() + parse_duration(duration)
-        minv = int(min_bid) if (min_bid and min_bid > 0) else DEFAULT_MIN_BID
+        end_ts = now_ts() + (AUCTION_DURATION_DEFAULT
+                             if duration is None else duration)
         aid = self.next_aid()
         unique_id = int(uid) if uid is not None else aid
-        channel_id = int(
-            interaction.channel_id) if interaction.channel_id else 0
+        channel_id = _channel_id(interaction)
 
         auc = {
             "auction_id": aid,
@@ -748,7 +1203,7 @@ class AuctionSystem(commands.Cog):
             "created_by": interaction.user.id,
             "created_ts": time.time(),
             "end_ts": end_ts,
-            "min_bid": minv,
+            "min_bid": min_bid,
             "top_bid": None,
             "bids_received": 0,
             "channel_id": channel_id,
@@ -756,16 +1211,15 @@ class AuctionSystem(commands.Cog):
         }
         self.save_auction(auc)
 
-        if aid in self.tasks and not self.tasks[aid].done():
-            self.tasks[aid].cancel()
-        self.tasks[aid] = asyncio.create_task(self._wait_and_close(aid))
+        self.schedule_close(aid, end_ts)
 
         bal = self.get_balance(interaction.user.id)
         ch = to_messageable(interaction.channel)
         if ch is not None:
-            await ch.send(embed=self.auction_embed(auc, viewer_balance=bal))
+            # ack first: the channel post is a separate round trip
             await interaction.response.send_message("✅ Auction started.",
                                                     ephemeral=True)
+            await ch.send(embed=self.auction_embed(auc, viewer_balance=bal))
         else:
             await interaction.response.send_message(
                 embed=self.auction_embed(auc, viewer_balance=bal))
@@ -775,13 +1229,13 @@ class AuctionSystem(commands.Cog):
         name="auction_start_gen",
         description="Start auctions for ALL Pokémon in a generation or a named list"
         )
-    @app_commands.guilds(discord.Object(id=DEFAULT_GUILD_ID))
+    @app_commands.guilds(_GUILD_OBJ)
     async def auction_start_gen(
             self,
             interaction: discord.Interaction,
             gen: str,                    # accepts '1'..'9' or a named list like 'meta'
-            duration: Optional[str] = None,
-            min_bid: Optional[int] = None,
+            duration: Optional[Duration] = None,
+            min_bid: MinBid = DEFAULT_MIN_BID,
             times: int = 1               # duplicate each mon this many times (grouped)
         ):
             g = gen.strip()
@@ -804,41 +1258,38 @@ class AuctionSystem(commands.Cog):
             # Grouped duplication: Gholdengo, Gholdengo, ..., Dragonite, Dragonite, ...
             if times < 1:
                 times = 1
-            grouped: List[str] = []
-            for p in names:
-                grouped.extend([p] * times)
-            names = grouped
+            names = [p for p in names for _ in range(times)]
 
-            end_ts = now_ts() + parse_duration(duration)
-            minv = int(min_bid) if (min_bid and min_bid > 0) else DEFAULT_MIN_BID
-            channel_id = int(interaction.channel_id) if interaction.channel_id else 0
+            end_ts = now_ts() + (AUCTION_DURATION_DEFAULT
+                                 if duration is None else duration)
+            channel_id = _channel_id(interaction)
 
             created_ids = self._create_auctions_for_names(
                 names=names,
                 created_by=interaction.user.id,
                 channel_id=channel_id,
                 end_ts=end_ts,
-                min_bid=minv,
+                min_bid=min_bid,
             )
 
+            await interaction.response.send_message("Done.", ephemeral=True)
             ch = to_messageable(interaction.channel)
             if ch is not None:
                 await ch.send(
                     f"✅ Started **{len(created_ids)}** auctions for **{label} × {times}**. Use `/auction_list` to browse."
                 )
-            await interaction.response.send_message("Done.", ephemeral=True)
         
 
     @app_commands.check(check_admin_whitelist)
     @app_commands.command(
         name="auction_start_multi",
         description="Start auctions for ALL Pokémon across multiple gens")
-    @app_commands.guilds(discord.Object(id=DEFAULT_GUILD_ID))
+    @app_commands.guilds(_GUILD_OBJ)
     async def auction_start_multi(self,
                                   interaction: discord.Interaction,
                                   gens: str,
-                                  duration: Optional[str] = None,
-                                  min_bid: Optional[int] = None):
+                                  duration: Optional[Duration] = None,
+                                  min_bid: MinBid = DEFAULT_MIN_BID):
         gen_list = parse_gens(gens)
         if not gen_list:
             return await interaction.response.send_message(
@@ -849,66 +1300,64 @@ class AuctionSystem(commands.Cog):
                 "❌ No Pokémon found for the given generations.",
                 ephemeral=True)
 
-        end_ts = now_ts() + parse_duration(duration)
-        minv = int(min_bid) if (min_bid and min_bid > 0) else DEFAULT_MIN_BID
-        channel_id = int(
-            interaction.channel_id) if interaction.channel_id else 0
+        end_ts = now_ts() + (AUCTION_DURATION_DEFAULT
+                             if duration is None else duration)
+        channel_id = _channel_id(interaction)
 
         created_ids = self._create_auctions_for_names(
             names=names,
             created_by=interaction.user.id,
             channel_id=channel_id,
             end_ts=end_ts,
-            min_bid=minv)
+            min_bid=min_bid)
 
+        await interaction.response.send_message("Done.", ephemeral=True)
         ch = to_messageable(interaction.channel)
         if ch is not None:
             gens_fmt = ", ".join(map(str, gen_list))
             await ch.send(
                 f"✅ Started **{len(created_ids)}** auctions for gens **{gens_fmt}**. Use `/auction_list` to browse."
             )
-        await interaction.response.send_message("Done.", ephemeral=True)
 
     @app_commands.check(check_admin_whitelist)
     @app_commands.command(
         name="auction_start_copies",
         description="Start many copies of a specific Pokémon")
-    @app_commands.guilds(discord.Object(id=DEFAULT_GUILD_ID))
+    @app_commands.guilds(_GUILD_OBJ)
     async def auction_start_copies(self,
                                    interaction: discord.Interaction,
                                    pokemon: str,
                                    count: int,
-                                   duration: Optional[str] = None,
-                                   min_bid: Optional[int] = None):
+                                   duration: Optional[Duration] = None,
+                                   min_bid: MinBid = DEFAULT_MIN_BID):
         copies = expand_copies(pokemon, count)
         if not copies:
             return await interaction.response.send_message(
                 "❌ Invalid Pokémon or count.", ephemeral=True)
 
-        end_ts = now_ts() + parse_duration(duration)
-        minv = int(min_bid) if (min_bid and min_bid > 0) else DEFAULT_MIN_BID
-        channel_id = int(
-            interaction.channel_id) if interaction.channel_id else 0
+        end_ts = now_ts() + (AUCTION_DURATION_DEFAULT
+                             if duration is None else duration)
+        channel_id = _channel_id(interaction)
 
         created_ids = self._create_auctions_for_names(
             names=copies,
             created_by=interaction.user.id,
             channel_id=channel_id,
             end_ts=end_ts,
-            min_bid=minv)
+            min_bid=min_bid)
 
+        await interaction.response.send_message("Done.", ephemeral=True)
         ch = to_messageable(interaction.channel)
         if ch is not None:
             await ch.send(
                 f"✅ Started **{len(created_ids)}** auctions for **{canon(pokemon)} × {len(created_ids)}**. Use `/auction_list`."
             )
-        await interaction.response.send_message("Done.", ephemeral=True)
 
     @app_commands.check(check_admin_whitelist)
     @app_commands.command(
         name="auction_close",
         description="Manually close & settle an auction by ID")
-    @app_commands.guilds(discord.Object(id=DEFAULT_GUILD_ID))
+    @app_commands.guilds(_GUILD_OBJ)
     async def auction_close(self, interaction: discord.Interaction, id: int):
         auc = self.get_auction(id)
         if not auc:
@@ -918,21 +1367,31 @@ class AuctionSystem(commands.Cog):
             return await interaction.response.send_message(
                 "⚠️ Auction already closed.", ephemeral=True)
 
-        t = self.tasks.get(id)
-        if t and not t.done():
-            t.cancel()
-
-        await self.settle_auction(auc,
-                                  announce_channel=to_messageable(
-                                      interaction.channel))
-        await interaction.response.send_message(f"✅ Auction #{id} settled.",
-                                                ephemeral=True)
+        # settling DMs the winner and posts a report: ack before that
+        await interaction.response.defer(ephemeral=True)
+        # a bid or the close timer may have landed during the defer; hold the
+        # bid lock so the auction we settle is the one bidders last saw
+        async with self.bid_lock(id):
+            auc = self.get_auction(id)
+            if not auc or auc.get("is_closed"):
+                # bid_lock() above may have just created this lock
+                self.release_bid_lock(id)
+                return await interaction.followup.send(
+                    "⚠️ Auction already closed.", ephemeral=True)
+            t = self.tasks.pop(id, None)
+            if t is not None:
+                t.cancel()
+            await self.settle_auction(auc,
+                                      announce_channel=to_messageable(
+                                          interaction.channel))
+        await interaction.followup.send(f"✅ Auction #{id} settled.",
+                                        ephemeral=True)
 
     @app_commands.check(check_admin_whitelist)
     @app_commands.command(
         name="auction_cancel",
         description="Cancel an auction (refund current top bidder)")
-    @app_commands.guilds(discord.Object(id=DEFAULT_GUILD_ID))
+    @app_commands.guilds(_GUILD_OBJ)
     async def auction_cancel(self, interaction: discord.Interaction, id: int):
         auc = self.get_auction(id)
         if not auc:
@@ -946,11 +1405,12 @@ class AuctionSystem(commands.Cog):
         if top:
             self.add_balance(int(top["user_id"]), int(top["amount"]))
 
-        auc["is_closed"] = True
+        auc = {**auc, "is_closed": True}
         self.save_auction(auc)
+        self.release_bid_lock(id)
 
-        t = self.tasks.get(id)
-        if t and not t.done():
+        t = self.tasks.pop(id, None)
+        if t is not None:
             t.cancel()
 
         await interaction.response.send_message(
@@ -959,7 +1419,7 @@ class AuctionSystem(commands.Cog):
 
     @app_commands.check(check_admin_whitelist)
     @app_commands.command(name="add_coins", description="Add coins to a user")
-    @app_commands.guilds(discord.Object(id=DEFAULT_GUILD_ID))
+    @app_commands.guilds(_GUILD_OBJ)
     async def add_coins(self, interaction: discord.Interaction,
                         member: discord.Member, amount: int):
         if amount == 0:
@@ -972,7 +1432,7 @@ class AuctionSystem(commands.Cog):
 
     @app_commands.check(check_admin_whitelist)
     @app_commands.command(name="set_coins", description="Set coins for a user")
-    @app_commands.guilds(discord.Object(id=DEFAULT_GUILD_ID))
+    @app_commands.guilds(_GUILD_OBJ)
     async def set_coins(self, interaction: discord.Interaction,
                         member: discord.Member, amount: int):
         self.set_balance(member.id, amount)
@@ -982,23 +1442,23 @@ class AuctionSystem(commands.Cog):
 
     @app_commands.check(check_admin_whitelist)
     @app_commands.command(name="ban", description="Ban a user from bidding")
-    @app_commands.guilds(discord.Object(id=DEFAULT_GUILD_ID))
+    @app_commands.guilds(_GUILD_OBJ)
     async def ban(self, interaction: discord.Interaction,
                   member: discord.Member):
         if member.id not in self.data["banned"]:
-            self.data["banned"].append(member.id)
-            save_data(self.data)
+            self.data["banned"].add(member.id)
+            self._mark_dirty()
         await interaction.response.send_message(
             f"✅ {member.display_name} is banned from bidding.", ephemeral=True)
 
     @app_commands.check(check_admin_whitelist)
     @app_commands.command(name="unban", description="Unban a user")
-    @app_commands.guilds(discord.Object(id=DEFAULT_GUILD_ID))
+    @app_commands.guilds(_GUILD_OBJ)
     async def unban(self, interaction: discord.Interaction,
                     member: discord.Member):
         if member.id in self.data["banned"]:
-            self.data["banned"].remove(member.id)
-            save_data(self.data)
+            self.data["banned"].discard(member.id)
+            self._mark_dirty()
             return await interaction.response.send_message(
                 f"✅ {member.display_name} is unbanned.", ephemeral=True)
         else:
@@ -1011,7 +1471,7 @@ class AuctionSystem(commands.Cog):
         description=
         "DANGER: Reset ALL auction data, coins, inventories, auctions, and bans"
     )
-    @app_commands.guilds(discord.Object(id=DEFAULT_GUILD_ID))
+    @app_commands.guilds(_GUILD_OBJ)
     async def auction_reset_all(self, interaction: discord.Interaction,
                                 confirm: str):
         if confirm != "CONFIRM":
@@ -1019,23 +1479,32 @@ class AuctionSystem(commands.Cog):
                 "⚠️ This will erase EVERYTHING. Re-run with `confirm: CONFIRM` to proceed.",
                 ephemeral=True)
 
-        # stop timers & clear locks
-        for t in list(self.tasks.values()):
-            try:
-                if t and not t.done():
-                    t.cancel()
-            except Exception:
-                pass
-        self.tasks.clear()
-        self.bid_locks.clear()
+        await interaction.response.defer(ephemeral=True)
+
+        # stop timers & drop locks; swapping in fresh containers means
+        # nothing armed while we await below gets cancelled by mistake
+        old_timers, self.tasks = self.tasks, {}
+        self.bid_locks = {}
+        for t in old_timers.values():
+            t.cancel()
+        # settlements already under way would write into the fresh state
+        settling, self._settling = self._settling, set()
+        for task in settling:
+            task.cancel()
+        await asyncio.gather(*settling, return_exceptions=True)
 
         # reset data
-        self.data = json.loads(json.dumps(DEFAULT_STATE))
-        save_data(self.data)
+        self.data = make_default_state()
+        self._rebuild_index()
+        self._line_cache.clear()
+        async with self._save_lock:
+            self.inventory = {}
+            self._inv_pending = []
+            await self._run_io(_truncate_inventory)
+        self._mark_dirty()
 
         # report
-        report_raw = self.bot.get_channel(AUCTION_REPORT_CHANNEL_ID)
-        ch = to_messageable(report_raw)
+        ch = self.report_channel()
         if ch is not None:
             try:
                 await ch.send(
@@ -1044,8 +1513,8 @@ class AuctionSystem(commands.Cog):
             except Exception as e:
                 pretty_log("warn", f"Could not post reset notice: {e}")
 
-        await interaction.response.send_message(
-            "✅ All auction data has been reset.", ephemeral=True)
+        await interaction.followup.send("✅ All auction data has been reset.",
+                                        ephemeral=True)
 
 
 # ---------------- Cog Setup ---------------- #
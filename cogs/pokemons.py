@@ -20,6 +20,7 @@ Exports:
 """
 
 from __future__ import annotations
+from functools import lru_cache
 from typing import Dict, List, Tuple, Optional
 
 # ---------------- Data, organized by generation ---------------- #
@@ -682,6 +683,7 @@ NAME_TO_CANON: Dict[str, str] = {p.lower(): p for p in ALL_POKEMONS}
 # ---------------- Helper functions ---------------- #
 
 
+@lru_cache(maxsize=1024)
 def canon(name: str) -> Optional[str]:
     if not name:
         return None
@@ -697,14 +699,20 @@ def by_gen(gen: int) -> List[str]:
 
 
 def by_gens(gens: List[int]) -> List[str]:
+    return list(_by_gens(tuple(sorted({int(x) for x in gens}))))
+
+
+# keys come from user input, so the caches stay bounded
+@lru_cache(maxsize=128)
+def _by_gens(gens: Tuple[int, ...]) -> Tuple[str, ...]:
     seen = set()
     out: List[str] = []
-    for g in sorted({int(x) for x in gens}):
+    for g in gens:
         for p in POKEMONS_BY_GEN.get(g, []):
             if p not in seen:
                 seen.add(p)
                 out.append(p)
-    return out
+    return tuple(out)
 
 
 def parse_gens(text: str) -> List[int]:
@@ -755,7 +763,11 @@ def list_names() -> List[str]:
 
 
 def get_named_list(name: str) -> List[str]:
-    key = name.strip().lower()
+    return list(_named_list(name.strip().lower()))
+
+
+@lru_cache(maxsize=128)
+def _named_list(key: str) -> Tuple[str, ...]:
     raw = NAMED_LISTS.get(key, [])
     out: List[str] = []
     for n in raw:
@@ -768,7 +780,7 @@ def get_named_list(name: str) -> List[str]:
         if n not in seen:
             seen.add(n)
             uniq.append(n)
-    return uniq
+    return tuple(uniq)
 
 
 __all__ = [
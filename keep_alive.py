@@ -1,17 +1,30 @@
-from flask import Flask
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from threading import Thread
 
-app = Flask('')
+BODY = b"Gholdengo is watching..."
 
 
-@app.route('/')
-def home():
-    return "Gholdengo is watching..."
+class Handler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def do_HEAD(self):
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass  # uptime pings would otherwise flood the console
 
 
 def run():
-    app.run(host='0.0.0.0', port=8080)
+    ThreadingHTTPServer(("0.0.0.0", 8080), Handler).serve_forever()
 
 
 def keep_alive():
-    Thread(target=run).start()
+    Thread(target=run, daemon=True).start()
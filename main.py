@@ -1,12 +1,13 @@
 # main.py
 import os
 import asyncio
+import signal
 import discord
 from discord.ext import commands
 from discord import app_commands
 
 from Constants.variables import DEFAULT_GUILD_ID, DATA_DIR
-from pretty_logs import pretty_log
+from pretty_logs import pretty_log, set_ghouldengo_bot
 
 # ---- Intents / Bot ----
 intents = discord.Intents.default()
@@ -14,10 +15,12 @@ intents.members = True
 intents.message_content = True
 
 bot = commands.Bot(command_prefix=";", intents=intents)
+GUILD_OBJ = discord.Object(id=DEFAULT_GUILD_ID)
+set_ghouldengo_bot(bot)  # lets pretty_log mirror warnings/errors to Discord
 
 # ---- Simple health check command ----
 @bot.tree.command(name="ping_test", description="Check if the bot is alive")
-@app_commands.guilds(discord.Object(id=DEFAULT_GUILD_ID))
+@app_commands.guilds(GUILD_OBJ)
 async def ping_test(interaction: discord.Interaction):
     await interaction.response.send_message("🏓 Pong!", ephemeral=True)
 
@@ -33,7 +36,7 @@ async def on_ready():
 
     try:
         # Fast guild-only sync
-        await bot.tree.sync(guild=discord.Object(id=DEFAULT_GUILD_ID))
+        await bot.tree.sync(guild=GUILD_OBJ)
         pretty_log("info", f"Slash commands synced to guild {DEFAULT_GUILD_ID}")
     except Exception as e:
         pretty_log("error", f"Slash sync failed: {e}")
@@ -54,14 +57,32 @@ async def main():
     if not token:
         raise RuntimeError("❌ DISCORD_TOKEN environment variable is not set.")
 
-    try:
-        await bot.load_extension("cogs.auctions")
-        pretty_log("info", "Loaded extension: cogs.auctions")
-    except Exception as e:
-        pretty_log("error", f"Failed to load cogs.auctions: {e}")
-        raise
+    # Uptime-pinger endpoint; opt-in so local runs don't bind port 8080
+    if os.getenv("KEEP_ALIVE"):
+        from keep_alive import keep_alive
+        keep_alive()
+
+    # leaving the block awaits bot.close(), which unloads the cogs so the
+    # auction cog flushes pending state (Ctrl-C cancels us into it)
+    async with bot:
+        try:
+            await bot.load_extension("cogs.auctions")
+            pretty_log("info", "Loaded extension: cogs.auctions")
+        except Exception as e:
+            pretty_log("error", f"Failed to load cogs.auctions: {e}")
+            raise
+
+        # SIGTERM (service stop / container shutdown) closes the same way
+        loop = asyncio.get_running_loop()
+        closing = []
+        try:
+            loop.add_signal_handler(
+                signal.SIGTERM,
+                lambda: closing.append(asyncio.create_task(bot.close())))
+        except NotImplementedError:
+            pass  # Windows event loops don't support signal handlers
 
-    await bot.start(token)
+        await bot.start(token)
 
 if __name__ == "__main__":
     try:
@@ -1,7 +1,9 @@
-# 🪙 utils.loggers.ghouldengo_logs import pretty_log
+# 🪙 from pretty_logs import pretty_log
 
+import asyncio
+import sys
+import time
 import traceback
-from datetime import datetime
 
 import discord
 from discord.ext import commands
@@ -45,11 +47,75 @@ MAIN_COLORS = {
     "reset": COLOR_RESET,
 }
 
+
+def _color_for(tag: str) -> str:
+    if tag in ("critical", "error"):
+        return MAIN_COLORS["red"]
+    if tag == "warn":
+        return MAIN_COLORS["orange"]
+    return MAIN_COLORS["yellow"]
+
+
+# tag -> (color, "[prefix] "), built once instead of on every log line
+_TAG_CACHE = {tag: (_color_for(tag), f"[{prefix}] ") for tag, prefix in TAGS.items()}
+_NO_TAG = (MAIN_COLORS["yellow"], "")
+
 # -------------------- ⚠️ Critical Logs Channel --------------------
 CRITICAL_LOG_CHANNEL_ID = (
     1410202143570530375  # TODO: replace with Gholdengo’s error log channel
 )
 
+# -------------------- 📨 Channel Log Queue --------------------
+# One consumer sends queued logs in order; a log storm fills the queue and
+# further lines are counted as dropped instead of piling up send tasks.
+LOG_QUEUE_MAX = 256
+_log_queue: "asyncio.Queue[tuple[discord.abc.Messageable, str]] | None" = None
+_log_consumer: "asyncio.Task | None" = None
+_dropped_logs = 0
+
+
+async def _drain_log_queue(queue: asyncio.Queue):
+    global _dropped_logs
+    while True:
+        channel, message = await queue.get()
+        if _dropped_logs:
+            note = f"⚠️ {_dropped_logs} log message(s) dropped (queue full)\n"
+            _dropped_logs = 0
+            message = (note + message)[:2000]
+        try:
+            await channel.send(message)
+        except Exception:
+            print("[❌ ERROR] Failed to send log to bot channel:")
+            traceback.print_exc()
+
+
+def _put_channel_log(loop: asyncio.AbstractEventLoop, channel, message: str):
+    # runs on the bot's loop thread only
+    global _log_queue, _log_consumer, _dropped_logs
+    if _log_consumer is None or _log_consumer.done():
+        # (re)start with a fresh queue: an old one may belong to a dead loop
+        _log_queue = asyncio.Queue(maxsize=LOG_QUEUE_MAX)
+        _log_consumer = loop.create_task(_drain_log_queue(_log_queue))
+    try:
+        _log_queue.put_nowait((channel, message))
+    except asyncio.QueueFull:
+        _dropped_logs += 1
+
+
+def _enqueue_channel_log(bot: commands.Bot, channel, message: str):
+    loop = getattr(bot, "loop", None)
+    if not isinstance(loop, asyncio.AbstractEventLoop) or loop.is_closed():
+        return  # bot not started yet, or already shut down: console only
+    try:
+        on_loop = asyncio.get_running_loop() is loop
+    except RuntimeError:
+        on_loop = False
+    if on_loop:
+        _put_channel_log(loop, channel, message)
+    else:
+        # called from a worker thread (file I/O, keep-alive server, ...)
+        loop.call_soon_threadsafe(_put_channel_log, loop, channel, message)
+
 
 # -------------------- 🌟 Pretty Log --------------------
 def pretty_log(
@@ -61,24 +127,17 @@ def pretty_log(
     include_trace: bool = True,
 ):
     """Gold-themed pretty log with timestamp + emoji (now pastel)."""
-    prefix = TAGS.get(tag) if tag else ""
-    prefix_part = f"[{prefix}] " if prefix else ""
+    color, prefix_part = _TAG_CACHE.get(tag, _NO_TAG)
     label_str = f"[{label}] " if label else ""
 
-    # Pick color
-    if tag in ("critical", "error"):
-        color = MAIN_COLORS["red"]
-    elif tag == "warn":
-        color = MAIN_COLORS["orange"]
-    else:
-        color = MAIN_COLORS["yellow"]
-
-    now = datetime.now().strftime("%H:%M:%S")
+    now = time.strftime("%H:%M:%S")
     log_message = f"{color}[{now}] {prefix_part}{label_str}{message}{COLOR_RESET}"
     print(log_message)
 
-    # Print traceback in console
-    if include_trace and tag in ("error", "critical"):
+    # Print traceback in console (only when there is one to print)
+    with_trace = (include_trace and tag in ("error", "critical")
+                  and sys.exc_info()[0] is not None)
+    if with_trace:
         traceback.print_exc()
 
     bot_to_use = bot or BOT_INSTANCE
@@ -89,11 +148,11 @@ def pretty_log(
             channel = bot_to_use.get_channel(CRITICAL_LOG_CHANNEL_ID)
             if channel:
                 full_message = f"{prefix_part}{label_str}{message}"
-                if include_trace and tag in ("error", "critical"):
+                if with_trace:
                     full_message += f"\n```py\n{traceback.format_exc()}```"
                 if len(full_message) > 2000:
                     full_message = full_message[:1997] + "..."
-                bot_to_use.loop.create_task(channel.send(full_message))
+                _enqueue_channel_log(bot_to_use, channel, full_message)
         except Exception:
             print("[❌ ERROR] Failed to send log to bot channel:")
             traceback.print_exc()
@@ -1,2 +1,2 @@
 """Logging utilities."""
-__all__ = ["pretty_logs"]
\ No newline at end of file
+__all__ = []